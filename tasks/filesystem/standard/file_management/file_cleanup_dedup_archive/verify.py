@@ -22,6 +22,10 @@ import sys
 import os
 import json
 import re
+import hashlib
+import io
+from collections import defaultdict
+from contextlib import redirect_stdout
 from pathlib import Path
 
 
@@ -32,17 +36,112 @@ def get_test_directory() -> Path:
     return Path(test_root)
 
 
+class Snapshot:
+    """Per-run cache of directory listings and report contents.
+
+    Several steps count or read the same directories and report files;
+    scanning each directory once and keeping one raw copy and one
+    lowercased copy per report means later steps reuse them instead of
+    walking the tree or re-reading and re-folding the file. Reports are
+    kept as bytes: they are ASCII markdown, and ``bytes.lower()`` skips
+    the Unicode case tables that ``str.lower()`` walks. Each report is
+    also decoded once as UTF-8: an undecodable report raises
+    ``UnicodeDecodeError`` as a text read would, and the decoded text is
+    kept for the regexes whose ``\b``, ``\d`` and ``\s`` must see Unicode.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop all cached listings and reports; main() calls this per run."""
+        self.dirs = set()
+        self.scanned = set()
+        self.listing = {}
+        self.data = {}
+        self.text_data = {}
+        self.lower_data = {}
+
+    def is_dir(self, path: str) -> bool:
+        """Directory check answered from one scan of the parent directory."""
+        parent = os.path.dirname(path)
+        if parent not in self.scanned:
+            self.scanned.add(parent)
+            try:
+                with os.scandir(parent) as it:
+                    self.dirs.update(e.path for e in it if e.is_dir())
+            except OSError:
+                pass
+        return path in self.dirs
+
+    def files(self, path: str) -> list:
+        """Regular files directly under ``path`` as cached ``os.DirEntry``s."""
+        if path not in self.listing:
+            with os.scandir(path) as it:
+                self.listing[path] = [e for e in it if e.is_file()]
+        return self.listing[path]
+
+    def read(self, path: str) -> bytes:
+        if path not in self.data:
+            data = read_bytes(path)
+            self.text_data[path] = data.decode("utf-8")
+            self.data[path] = data
+        return self.data[path]
+
+    def text(self, path: str) -> str:
+        self.read(path)
+        return self.text_data[path]
+
+    def lower(self, path: str) -> bytes:
+        if path not in self.lower_data:
+            self.lower_data[path] = self.read(path).lower()
+        return self.lower_data[path]
+
+
+snap = Snapshot()
+
+
+def read_bytes(path) -> bytes:
+    """Whole-file read through an unbuffered FileIO; no text decoding layer."""
+    with open(path, "rb", buffering=0) as f:
+        return f.readall()
+
+
+def encode_markers(markers) -> tuple:
+    """(marker, UTF-8 bytes) pairs for scan_markers, built once at import."""
+    return tuple((m, m.encode()) for m in markers)
+
+
+def scan_markers(buf: bytes, encoded: tuple) -> set:
+    """Return the str markers whose encoded form is present in ``buf``."""
+    return {m for m, m_bytes in encoded if m_bytes in buf}
+
+
+def mentions_number(text: str, n: int) -> bool:
+    """True if ``n`` appears in ``text`` as a standalone integer.
+
+    The ASCII spelling is searched for directly; only non-ASCII text can
+    spell ``n`` with other Unicode digits (e.g. "١٨"), so only then are the
+    digit runs parsed one by one.
+    """
+    if re.search(r"\b0*%d\b" % n, text):
+        return True
+    return not text.isascii() and any(int(d) == n for d in re.findall(r"\b(\d+)\b", text))
+
+
 # ============================================================
 # Step 1: Directory Structure
 # ============================================================
-def verify_directory_structure(test_dir: Path) -> bool:
-    required = [
-        "organized", "organized/csv", "organized/json", "organized/txt",
-        "drafts", "quarantine",
-    ]
+REQUIRED_DIRS = (
+    "organized", "organized/csv", "organized/json", "organized/txt",
+    "drafts", "quarantine",
+)
+
+
+def verify_directory_structure(test_dir: str) -> bool:
     all_ok = True
-    for d in required:
-        if not (test_dir / d).is_dir():
+    for d in REQUIRED_DIRS:
+        if not snap.is_dir(os.path.join(test_dir, d)):
             print(f"  [FAIL] Directory '{d}/' missing")
             all_ok = False
     if all_ok:
@@ -53,12 +152,12 @@ def verify_directory_structure(test_dir: Path) -> bool:
 # ============================================================
 # Step 2: CSV count EXACTLY 9
 # ============================================================
-def verify_csv_count(test_dir: Path) -> bool:
-    csv_dir = test_dir / "organized" / "csv"
-    if not csv_dir.is_dir():
+def verify_csv_count(test_dir: str) -> bool:
+    csv_dir = os.path.join(test_dir, "organized", "csv")
+    if not snap.is_dir(csv_dir):
         print("  [FAIL] organized/csv/ not found")
         return False
-    files = [f for f in csv_dir.iterdir() if f.is_file()]
+    files = snap.files(csv_dir)
     if len(files) == 9:
         print(f"  [PASS] organized/csv/ has exactly 9 files")
         return True
@@ -70,33 +169,36 @@ def verify_csv_count(test_dir: Path) -> bool:
 # ============================================================
 # Step 3: CSV content verification (all 9 present)
 # ============================================================
-def verify_csv_content(test_dir: Path) -> bool:
-    csv_dir = test_dir / "organized" / "csv"
-    if not csv_dir.is_dir():
+CSV_MARKERS = {
+    "q1_sales": ("Widget A", "4500.00"),
+    "server_metrics": ("cpu_usage", "memory_mb"),
+    "daily_jan15": ("api_latency_p95", "15847"),
+    "daily_feb03": ("16203", "82.3"),
+    "quarterly_forecast": ("projected_revenue", "variance_pct"),
+    "team_contacts": ("alice.chen", "Engineering"),
+    "department_budgets": ("Operations", "287100"),
+    "sales_data_final": ("Acme Corp", "ORD-001"),
+    "q1_v2": ("12400.00", "2026-03-28"),  # the EXTRA row in v2
+}
+CSV_ALL_MARKERS = tuple(m for markers in CSV_MARKERS.values() for m in markers)
+CSV_SCAN_MARKERS = encode_markers(CSV_ALL_MARKERS)
+
+
+def verify_csv_content(test_dir: str) -> bool:
+    csv_dir = os.path.join(test_dir, "organized", "csv")
+    if not snap.is_dir(csv_dir):
         print("  [FAIL] organized/csv/ not found")
         return False
 
-    expected = {
-        "q1_sales": ("Widget A", "4500.00"),
-        "server_metrics": ("cpu_usage", "memory_mb"),
-        "daily_jan15": ("api_latency_p95", "15847"),
-        "daily_feb03": ("16203", "82.3"),
-        "quarterly_forecast": ("projected_revenue", "variance_pct"),
-        "team_contacts": ("alice.chen", "Engineering"),
-        "department_budgets": ("Operations", "287100"),
-        "sales_data_final": ("Acme Corp", "ORD-001"),
-        "q1_v2": ("12400.00", "2026-03-28"),  # the EXTRA row in v2
-    }
-
-    all_content = ""
-    for f in csv_dir.iterdir():
-        if f.is_file():
-            all_content += f.read_text(encoding="utf-8", errors="replace")
+    found = set()
+    for f in snap.files(csv_dir):
+        found |= scan_markers(read_bytes(f.path), CSV_SCAN_MARKERS)
+        if len(found) == len(CSV_ALL_MARKERS):
+            break
 
     all_ok = True
-    for key, markers in expected.items():
-        found = all(m in all_content for m in markers)
-        if found:
+    for key, markers in CSV_MARKERS.items():
+        if all(m in found for m in markers):
             print(f"    [PASS] '{key}' content found")
         else:
             print(f"    [FAIL] '{key}' content missing")
@@ -107,20 +209,19 @@ def verify_csv_content(test_dir: Path) -> bool:
 # ============================================================
 # Step 4: Near-duplicate KEPT (v2 csv must be in organized)
 # ============================================================
-def verify_near_duplicate_kept(test_dir: Path) -> bool:
+def verify_near_duplicate_kept(test_dir: str) -> bool:
     """Q1_Sales_Report_v2.csv has extra row '2026-03-28,Gadget X,310,12400.00,West'
     It must NOT be treated as a duplicate. Must be in organized/csv/."""
-    csv_dir = test_dir / "organized" / "csv"
-    if not csv_dir.is_dir():
+    csv_dir = os.path.join(test_dir, "organized", "csv")
+    if not snap.is_dir(csv_dir):
         print("  [FAIL] organized/csv/ not found")
         return False
 
-    for f in csv_dir.iterdir():
-        if f.is_file():
-            content = f.read_text(encoding="utf-8", errors="replace")
-            if "12400.00" in content and "2026-03-28" in content:
-                print(f"  [PASS] Near-duplicate Q1_Sales_Report_v2 found in organized/csv/ as '{f.name}'")
-                return True
+    for f in snap.files(csv_dir):
+        content = read_bytes(f.path)
+        if b"12400.00" in content and b"2026-03-28" in content:
+            print(f"  [PASS] Near-duplicate Q1_Sales_Report_v2 found in organized/csv/ as '{f.name}'")
+            return True
 
     print("  [FAIL] Near-duplicate Q1_Sales_Report_v2 (with row '2026-03-28') NOT found in organized/csv/")
     print("         Model likely incorrectly deduped it against Q1_Sales_Report.csv")
@@ -130,13 +231,23 @@ def verify_near_duplicate_kept(test_dir: Path) -> bool:
 # ============================================================
 # Step 5: JSON count EXACTLY 5, all valid
 # ============================================================
-def verify_json_organized(test_dir: Path) -> bool:
-    json_dir = test_dir / "organized" / "json"
-    if not json_dir.is_dir():
+JSON_MARKERS = {
+    "config": "DataPipeline",
+    "summary_stats": "1245000.50",
+    "api_endpoints": "api.company.com",
+    "project_timeline": "Platform Migration",
+    "backup_config": "company-backups-prod",
+}
+JSON_SCAN_MARKERS = encode_markers(JSON_MARKERS.values())
+
+
+def verify_json_organized(test_dir: str) -> bool:
+    json_dir = os.path.join(test_dir, "organized", "json")
+    if not snap.is_dir(json_dir):
         print("  [FAIL] organized/json/ not found")
         return False
 
-    files = [f for f in json_dir.iterdir() if f.is_file()]
+    files = snap.files(json_dir)
     if len(files) != 5:
         print(f"  [FAIL] Expected 5 JSON files, found {len(files)}: {sorted(f.name for f in files)}")
         return False
@@ -144,27 +255,21 @@ def verify_json_organized(test_dir: Path) -> bool:
 
     # All must be valid JSON
     all_ok = True
+    contents = []
     for f in files:
+        content = read_bytes(f.path)
+        contents.append(content)
         try:
-            content = f.read_text(encoding="utf-8")
-            json.loads(content)
+            json.loads(content.decode("utf-8"))
         except (json.JSONDecodeError, UnicodeDecodeError):
             print(f"    [FAIL] {f.name} is NOT valid JSON")
             all_ok = False
 
     # Content markers
-    expected = {
-        "config": "DataPipeline",
-        "summary_stats": "1245000.50",
-        "api_endpoints": "api.company.com",
-        "project_timeline": "Platform Migration",
-        "backup_config": "company-backups-prod",
-    }
-    all_content = ""
-    for f in files:
-        all_content += f.read_text(encoding="utf-8", errors="replace")
-    for key, marker in expected.items():
-        if marker in all_content:
+    all_content = b"".join(contents)
+    found = scan_markers(all_content, JSON_SCAN_MARKERS)
+    for key, marker in JSON_MARKERS.items():
+        if marker in found:
             print(f"    [PASS] '{key}' content found")
         else:
             print(f"    [FAIL] '{key}' content missing")
@@ -175,30 +280,35 @@ def verify_json_organized(test_dir: Path) -> bool:
 # ============================================================
 # Step 6: TXT count EXACTLY 4
 # ============================================================
-def verify_txt_organized(test_dir: Path) -> bool:
-    txt_dir = test_dir / "organized" / "txt"
-    if not txt_dir.is_dir():
+TXT_MARKERS = {
+    "meeting_jan": "January 2026 Planning",
+    "error_log": "DatabaseConnection",
+    "weekly_summary": "Weekly Summary",
+    "old_meeting": "December 2025 Retrospective",
+}
+TXT_SCAN_MARKERS = encode_markers(TXT_MARKERS.values())
+
+
+def verify_txt_organized(test_dir: str) -> bool:
+    txt_dir = os.path.join(test_dir, "organized", "txt")
+    if not snap.is_dir(txt_dir):
         print("  [FAIL] organized/txt/ not found")
         return False
 
-    files = [f for f in txt_dir.iterdir() if f.is_file()]
+    files = snap.files(txt_dir)
     if len(files) != 4:
         print(f"  [FAIL] Expected 4 TXT files, found {len(files)}: {sorted(f.name for f in files)}")
         return False
     print(f"  [PASS] organized/txt/ has 4 files")
 
-    expected = {
-        "meeting_jan": "January 2026 Planning",
-        "error_log": "DatabaseConnection",
-        "weekly_summary": "Weekly Summary",
-        "old_meeting": "December 2025 Retrospective",
-    }
-    all_content = ""
+    found = set()
     for f in files:
-        all_content += f.read_text(encoding="utf-8", errors="replace")
+        found |= scan_markers(read_bytes(f.path), TXT_SCAN_MARKERS)
+        if len(found) == len(TXT_MARKERS):
+            break
     all_ok = True
-    for key, marker in expected.items():
-        if marker in all_content:
+    for key, marker in TXT_MARKERS.items():
+        if marker in found:
             print(f"    [PASS] '{key}' content found")
         else:
             print(f"    [FAIL] '{key}' content missing")
@@ -209,25 +319,30 @@ def verify_txt_organized(test_dir: Path) -> bool:
 # ============================================================
 # Step 7: Drafts EXACTLY 4 (non-empty drafts only)
 # ============================================================
-def verify_drafts(test_dir: Path) -> bool:
-    drafts_dir = test_dir / "drafts"
-    if not drafts_dir.is_dir():
+DRAFT_MARKERS = ("Budget Proposal", "Code Review", "Roadmap", "Migration Proposal")
+DRAFT_SCAN_MARKERS = encode_markers(DRAFT_MARKERS)
+
+
+def verify_drafts(test_dir: str) -> bool:
+    drafts_dir = os.path.join(test_dir, "drafts")
+    if not snap.is_dir(drafts_dir):
         print("  [FAIL] drafts/ not found")
         return False
 
-    files = [f for f in drafts_dir.iterdir() if f.is_file()]
+    files = snap.files(drafts_dir)
     if len(files) != 4:
         print(f"  [FAIL] Expected 4 draft files, found {len(files)}: {sorted(f.name for f in files)}")
         return False
     print(f"  [PASS] drafts/ has 4 files")
 
-    expected_content = ["Budget Proposal", "Code Review", "Roadmap", "Migration Proposal"]
-    all_content = ""
+    found = set()
     for f in files:
-        all_content += f.read_text(encoding="utf-8", errors="replace")
+        found |= scan_markers(read_bytes(f.path), DRAFT_SCAN_MARKERS)
+        if len(found) == len(DRAFT_MARKERS):
+            break
     all_ok = True
-    for marker in expected_content:
-        if marker in all_content:
+    for marker in DRAFT_MARKERS:
+        if marker in found:
             print(f"    [PASS] Draft '{marker}' found")
         else:
             print(f"    [FAIL] Draft '{marker}' missing")
@@ -238,30 +353,34 @@ def verify_drafts(test_dir: Path) -> bool:
 # ============================================================
 # Step 8: Quarantine EXACTLY 3 malformed JSONs
 # ============================================================
-def verify_quarantine(test_dir: Path) -> bool:
-    q_dir = test_dir / "quarantine"
-    if not q_dir.is_dir():
+QUARANTINE_MARKERS = {
+    "analysis_results": "EXP-2026-042",
+    "broken_export": "legacy_database",
+    "legacy_config": "legacy_service",
+}
+QUARANTINE_SCAN_MARKERS = encode_markers(QUARANTINE_MARKERS.values())
+
+
+def verify_quarantine(test_dir: str) -> bool:
+    q_dir = os.path.join(test_dir, "quarantine")
+    if not snap.is_dir(q_dir):
         print("  [FAIL] quarantine/ not found")
         return False
 
-    files = [f for f in q_dir.iterdir() if f.is_file()]
+    files = snap.files(q_dir)
     if len(files) != 3:
         print(f"  [FAIL] Expected 3 quarantined files, found {len(files)}: {sorted(f.name for f in files)}")
         return False
     print(f"  [PASS] quarantine/ has 3 files")
 
-    all_content = ""
-    for f in files:
-        all_content += f.read_text(encoding="utf-8", errors="replace")
-
     all_ok = True
-    markers = {
-        "analysis_results": "EXP-2026-042",
-        "broken_export": "legacy_database",
-        "legacy_config": "legacy_service",
-    }
-    for name, marker in markers.items():
-        if marker in all_content:
+    found = set()
+    for f in files:
+        found |= scan_markers(read_bytes(f.path), QUARANTINE_SCAN_MARKERS)
+        if len(found) == len(QUARANTINE_MARKERS):
+            break
+    for name, marker in QUARANTINE_MARKERS.items():
+        if marker in found:
             print(f"    [PASS] '{name}' in quarantine")
         else:
             print(f"    [FAIL] '{name}' missing from quarantine")
@@ -272,34 +391,33 @@ def verify_quarantine(test_dir: Path) -> bool:
 # ============================================================
 # Step 9: Priority conflict — DRAFT_empty.txt in trash NOT drafts
 # ============================================================
-def verify_priority_conflict(test_dir: Path) -> bool:
+def verify_priority_conflict(test_dir: str) -> bool:
     """DRAFT_empty.txt is both empty AND has DRAFT in name.
     Rule A (empty→trash) has priority over Rule B (draft→drafts).
     It must NOT be in drafts/."""
-    drafts_dir = test_dir / "drafts"
-
-    if drafts_dir.is_dir():
-        for f in drafts_dir.iterdir():
-            if f.is_file():
-                name_lower = f.name.lower()
-                if "draft_empty" in name_lower or "empty" in name_lower:
-                    content = f.read_text(encoding="utf-8", errors="replace").strip()
-                    if len(content) == 0:
-                        print("  [FAIL] DRAFT_empty.txt found in drafts/ — it's empty, should be in trash/ (Rule A > Rule B)")
-                        return False
+    drafts_dir = os.path.join(test_dir, "drafts")
+
+    if snap.is_dir(drafts_dir):
+        for f in snap.files(drafts_dir):
+            if "empty" in f.name.lower():
+                # Decoded so that Unicode whitespace also counts as empty
+                content = read_bytes(f.path).decode("utf-8", errors="replace").strip()
+                if len(content) == 0:
+                    print("  [FAIL] DRAFT_empty.txt found in drafts/ — it's empty, should be in trash/ (Rule A > Rule B)")
+                    return False
 
     # Check it's properly handled (in trash, deleted, or not in organized)
     organized_dirs = [
-        test_dir / "organized" / "csv",
-        test_dir / "organized" / "json",
-        test_dir / "organized" / "txt",
+        os.path.join(test_dir, "organized", "csv"),
+        os.path.join(test_dir, "organized", "json"),
+        os.path.join(test_dir, "organized", "txt"),
     ]
-    for od in organized_dirs:
-        if od.is_dir():
-            for f in od.iterdir():
-                if "draft_empty" in f.name.lower():
-                    print("  [FAIL] DRAFT_empty.txt found in organized/ — it's empty, should be in trash/")
-                    return False
+    # One lazy pass over the cached names of all organized dirs; stops at the first hit
+    if any("draft_empty" in f.name.lower()
+           for od in organized_dirs if snap.is_dir(od)
+           for f in snap.files(od)):
+        print("  [FAIL] DRAFT_empty.txt found in organized/ — it's empty, should be in trash/")
+        return False
 
     print("  [PASS] DRAFT_empty.txt correctly NOT in drafts/ or organized/ (empty file priority)")
     return True
@@ -308,42 +426,48 @@ def verify_priority_conflict(test_dir: Path) -> bool:
 # ============================================================
 # Step 10: No duplicate content in organized/
 # ============================================================
-def verify_no_duplicates(test_dir: Path) -> bool:
-    organized = test_dir / "organized"
-    if not organized.is_dir():
+def verify_no_duplicates(test_dir: str) -> bool:
+    organized = os.path.join(test_dir, "organized")
+    if not snap.is_dir(organized):
         print("  [FAIL] organized/ not found")
         return False
 
-    contents = {}
-    all_ok = True
+    # Byte-identical files must share a size; one stat per dirent buckets them
+    buckets = defaultdict(list)
     for subdir in ["csv", "json", "txt"]:
-        sd = organized / subdir
-        if sd.is_dir():
-            for f in sd.iterdir():
-                if f.is_file():
-                    content = f.read_text(encoding="utf-8", errors="replace").strip()
-                    key = content[:300]
-                    if key in contents:
-                        print(f"  [FAIL] Duplicate content: '{f.name}' matches '{contents[key]}'")
-                        all_ok = False
-                    else:
-                        contents[key] = f.name
-
-    if all_ok:
-        print("  [PASS] No duplicate content in organized/")
-    return all_ok
+        sd = os.path.join(organized, subdir)
+        if snap.is_dir(sd):
+            for f in snap.files(sd):
+                buckets[f.stat().st_size].append(f)
+
+    # Only shared-size buckets are read; zero-byte files need no read at all
+    for size, bucket in buckets.items():
+        if len(bucket) < 2:
+            continue
+        digests = {}
+        for f in bucket:
+            data = read_bytes(f.path) if size else b""
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest in digests:
+                print(f"  [FAIL] Duplicate content: '{f.name}' matches '{digests[digest]}'")
+                return False
+            digests[digest] = f.name
+
+    print("  [PASS] No duplicate content in organized/")
+    return True
 
 
 # ============================================================
 # Step 11: Hidden file + .md files preserved
 # ============================================================
-def verify_preserved(test_dir: Path) -> bool:
+def verify_preserved(test_dir: str) -> bool:
+    # The preserved files must still be valid UTF-8; a failed decode raises
     all_ok = True
 
     # .gitignore in root
-    gitignore = test_dir / ".gitignore"
-    if gitignore.is_file():
-        content = gitignore.read_text(encoding="utf-8")
+    gitignore = os.path.join(test_dir, ".gitignore")
+    if os.path.isfile(gitignore):
+        content = read_bytes(gitignore).decode("utf-8")
         if "__pycache__" in content:
             print("  [PASS] .gitignore preserved")
         else:
@@ -354,16 +478,16 @@ def verify_preserved(test_dir: Path) -> bool:
         all_ok = False
 
     # shared/README.md
-    readme = test_dir / "shared" / "README.md"
-    if readme.is_file() and "Shared Workspace" in readme.read_text(encoding="utf-8"):
+    readme = os.path.join(test_dir, "shared", "README.md")
+    if os.path.isfile(readme) and "Shared Workspace" in read_bytes(readme).decode("utf-8"):
         print("  [PASS] shared/README.md preserved")
     else:
         print("  [FAIL] shared/README.md missing or modified")
         all_ok = False
 
     # project_overview.md
-    overview = test_dir / "project_overview.md"
-    if overview.is_file() and "Platform Migration" in overview.read_text(encoding="utf-8"):
+    overview = os.path.join(test_dir, "project_overview.md")
+    if os.path.isfile(overview) and "Platform Migration" in read_bytes(overview).decode("utf-8"):
         print("  [PASS] project_overview.md preserved")
     else:
         print("  [FAIL] project_overview.md missing or modified")
@@ -375,50 +499,55 @@ def verify_preserved(test_dir: Path) -> bool:
 # ============================================================
 # Step 12: Inventory report — all 18 organized files listed
 # ============================================================
-def verify_inventory(test_dir: Path) -> bool:
-    inv = test_dir / "inventory.md"
-    if not inv.is_file():
+INVENTORY_CATEGORIES = ("csv", "json", "txt")
+INVENTORY_FILES = (
+    "q1_sales_report", "q1_sales_report_v2", "server_metrics",
+    "daily_report", "quarterly_forecast", "team_contacts",
+    "department_budgets", "sales_data",
+    "config_v2", "summary_stats", "api_endpoints", "project_timeline",
+    "backup_config",
+    "meeting_notes", "error_log", "weekly_summary", "old_meeting",
+)
+INVENTORY_SCAN_MARKERS = encode_markers(INVENTORY_CATEGORIES + INVENTORY_FILES)
+
+
+def verify_inventory(test_dir: str) -> bool:
+    inv = os.path.join(test_dir, "inventory.md")
+    if not os.path.isfile(inv):
         print("  [FAIL] inventory.md not found")
         return False
 
-    content = inv.read_text(encoding="utf-8")
-    cl = content.lower()
+    content = snap.read(inv)
+    cl = snap.lower(inv)
 
     all_ok = True
+    present = scan_markers(cl, INVENTORY_SCAN_MARKERS)
 
     # Must have all 3 categories
-    for cat in ["csv", "json", "txt"]:
-        if cat not in cl:
+    for cat in INVENTORY_CATEGORIES:
+        if cat not in present:
             print(f"  [FAIL] Missing '{cat}' category")
             all_ok = False
 
     # Must mention key files (check at least 14 of 18)
-    expected_files = [
-        "q1_sales_report", "q1_sales_report_v2", "server_metrics",
-        "daily_report", "quarterly_forecast", "team_contacts",
-        "department_budgets", "sales_data",
-        "config_v2", "summary_stats", "api_endpoints", "project_timeline",
-        "backup_config",
-        "meeting_notes", "error_log", "weekly_summary", "old_meeting",
-    ]
-    found = sum(1 for f in expected_files if f in cl)
+    found = sum(1 for f in INVENTORY_FILES if f in present)
     if found >= 14:
-        print(f"  [PASS] Inventory mentions {found}/{len(expected_files)} expected files")
+        print(f"  [PASS] Inventory mentions {found}/{len(INVENTORY_FILES)} expected files")
     else:
-        print(f"  [FAIL] Inventory only mentions {found}/{len(expected_files)} files")
+        print(f"  [FAIL] Inventory only mentions {found}/{len(INVENTORY_FILES)} files")
         all_ok = False
 
     # Must have "kb" (file sizes)
-    if "kb" in cl:
+    if b"kb" in cl:
         print("  [PASS] File sizes present")
     else:
         print("  [FAIL] File sizes missing")
         all_ok = False
 
     # Must mention total count
-    if "18" in content:
+    if b"18" in content:
         print("  [PASS] Total count 18 found")
-    elif "19" in content:
+    elif b"19" in content:
         print("  [WARN] Total count 19 found (close)")
     else:
         print("  [FAIL] Expected total organized count ~18 not found")
@@ -430,36 +559,47 @@ def verify_inventory(test_dir: Path) -> bool:
 # ============================================================
 # Step 13: Duplicates report — mentions both pairs
 # ============================================================
-def verify_duplicates_report(test_dir: Path) -> bool:
-    candidates = ["duplicates_report.md", "duplicate_report.md", "duplicates.md"]
+DUPLICATES_CANDIDATES = ("duplicates_report.md", "duplicate_report.md", "duplicates.md")
+# One case-insensitive pass; the matching group names say what was mentioned
+DUPLICATES_RE = re.compile(
+    rb"(?P<q1>q1_sales|sales_backup|sales_report)"
+    rb"|(?P<server>server_metrics|server metrics)"
+    rb"|(?P<duplicate>duplicate)"
+    rb"|(?P<two>2)",
+    re.IGNORECASE,
+)
+
+
+def verify_duplicates_report(test_dir: str) -> bool:
     dup = None
-    for c in candidates:
-        if (test_dir / c).is_file():
-            dup = test_dir / c
+    for c in DUPLICATES_CANDIDATES:
+        path = os.path.join(test_dir, c)
+        if os.path.isfile(path):
+            dup = path
             break
     if not dup:
         print("  [FAIL] duplicates_report.md not found")
         return False
 
-    content = dup.read_text(encoding="utf-8").lower()
+    mentioned = {m.lastgroup for m in DUPLICATES_RE.finditer(snap.read(dup))}
     all_ok = True
 
     # Q1 sales duplicate
-    if any(kw in content for kw in ["q1_sales", "sales_backup", "sales_report"]):
+    if "q1" in mentioned:
         print("  [PASS] Q1 sales duplicate mentioned")
     else:
         print("  [FAIL] Q1 sales duplicate not mentioned")
         all_ok = False
 
     # Server metrics duplicate
-    if any(kw in content for kw in ["server_metrics", "server metrics"]):
+    if "server" in mentioned:
         print("  [PASS] Server metrics duplicate mentioned")
     else:
         print("  [FAIL] Server metrics duplicate not mentioned")
         all_ok = False
 
     # Must mention "2" duplicates (exactly 2 pairs)
-    if "2" in content and "duplicate" in content:
+    if "two" in mentioned and "duplicate" in mentioned:
         print("  [PASS] Reports 2 duplicates")
     else:
         print("  [WARN] Duplicate count may not be exactly 2")
@@ -470,34 +610,35 @@ def verify_duplicates_report(test_dir: Path) -> bool:
 # ============================================================
 # Step 14: Audit summary — correct statistics
 # ============================================================
-def verify_audit_summary(test_dir: Path) -> bool:
-    candidates = ["audit_summary.md", "audit.md", "summary.md"]
+# Expected: organized=18, duplicates=2, quarantined=3, drafts=4, empty=3, preserved=3
+AUDIT_CHECKS = {
+    "organized": (18, (b"organized", b"organiz")),
+    "quarantined": (3, (b"quarantine", b"malformed", b"invalid")),
+    "drafts": (4, (b"draft",)),
+    "empty/trash": (3, (b"empty", b"trash", b"discard")),
+}
+AUDIT_TYPES = (b"csv", b"json", b"txt")
+AUDIT_CANDIDATES = ("audit_summary.md", "audit.md", "summary.md")
+
+
+def verify_audit_summary(test_dir: str) -> bool:
     audit = None
-    for c in candidates:
-        if (test_dir / c).is_file():
-            audit = test_dir / c
+    for c in AUDIT_CANDIDATES:
+        path = os.path.join(test_dir, c)
+        if os.path.isfile(path):
+            audit = path
             break
     if not audit:
         print("  [FAIL] audit_summary.md not found")
         return False
 
-    content = audit.read_text(encoding="utf-8")
-    cl = content.lower()
+    text = snap.text(audit)
+    cl = snap.lower(audit)
 
     all_ok = True
-    numbers = [int(n) for n in re.findall(r'\b(\d+)\b', content)]
-
-    # Expected: organized=18, duplicates=2, quarantined=3, drafts=4, empty=3, preserved=3
-    checks = {
-        "organized": (18, ["organized", "organiz"]),
-        "quarantined": (3, ["quarantine", "malformed", "invalid"]),
-        "drafts": (4, ["draft"]),
-        "empty/trash": (3, ["empty", "trash", "discard"]),
-    }
-
-    for label, (expected_num, keywords) in checks.items():
+    for label, (expected_num, keywords) in AUDIT_CHECKS.items():
         kw_found = any(kw in cl for kw in keywords)
-        num_found = expected_num in numbers
+        num_found = mentions_number(text, expected_num)
         if kw_found and num_found:
             print(f"  [PASS] '{label}' = {expected_num}")
         elif kw_found:
@@ -508,7 +649,7 @@ def verify_audit_summary(test_dir: Path) -> bool:
             all_ok = False
 
     # Check per-type breakdown
-    if "csv" in cl and "json" in cl and "txt" in cl:
+    if all(t in cl for t in AUDIT_TYPES):
         print("  [PASS] Per-type breakdown present")
     else:
         print("  [FAIL] Per-type breakdown missing")
@@ -520,33 +661,39 @@ def verify_audit_summary(test_dir: Path) -> bool:
 # ============================================================
 # Step 15: Cross-report consistency
 # ============================================================
-def verify_cross_consistency(test_dir: Path) -> bool:
+# A listed file: a "- " bullet naming a .csv/.json/.txt file
+INVENTORY_LINE_RE = re.compile(r'^\s*-\s+\S+\.(?:csv|json|txt)', re.MULTILINE | re.IGNORECASE)
+
+
+def verify_cross_consistency(test_dir: str) -> bool:
     """Numbers across all 3 reports AND actual directories must be consistent."""
     all_ok = True
 
     # Count actual files in directories
     actual_counts = {}
     for subdir in ["csv", "json", "txt"]:
-        sd = test_dir / "organized" / subdir
-        if sd.is_dir():
-            actual_counts[subdir] = len([f for f in sd.iterdir() if f.is_file()])
+        sd = os.path.join(test_dir, "organized", subdir)
+        if snap.is_dir(sd):
+            actual_counts[subdir] = len(snap.files(sd))
         else:
             actual_counts[subdir] = 0
 
     actual_total = sum(actual_counts.values())
+    drafts_dir = os.path.join(test_dir, "drafts")
     actual_drafts = 0
-    if (test_dir / "drafts").is_dir():
-        actual_drafts = len([f for f in (test_dir / "drafts").iterdir() if f.is_file()])
+    if snap.is_dir(drafts_dir):
+        actual_drafts = len(snap.files(drafts_dir))
+    q_dir = os.path.join(test_dir, "quarantine")
     actual_quarantine = 0
-    if (test_dir / "quarantine").is_dir():
-        actual_quarantine = len([f for f in (test_dir / "quarantine").iterdir() if f.is_file()])
+    if snap.is_dir(q_dir):
+        actual_quarantine = len(snap.files(q_dir))
 
     # Check inventory file count matches actual
-    inv = test_dir / "inventory.md"
-    if inv.is_file():
-        inv_content = inv.read_text(encoding="utf-8")
+    inv = os.path.join(test_dir, "inventory.md")
+    if os.path.isfile(inv):
+        inv_content = snap.text(inv)
         # Count listed files (lines starting with "- ")
-        listed_files = len(re.findall(r'^\s*-\s+\S+\.(csv|json|txt)', inv_content, re.MULTILINE | re.IGNORECASE))
+        listed_files = sum(1 for _ in INVENTORY_LINE_RE.finditer(inv_content))
         if listed_files == actual_total:
             print(f"  [PASS] Inventory lists {listed_files} files = actual {actual_total}")
         elif abs(listed_files - actual_total) <= 1:
@@ -556,25 +703,24 @@ def verify_cross_consistency(test_dir: Path) -> bool:
             all_ok = False
 
     # Check audit numbers match actual
-    candidates = ["audit_summary.md", "audit.md", "summary.md"]
     audit = None
-    for c in candidates:
-        if (test_dir / c).is_file():
-            audit = test_dir / c
+    for c in AUDIT_CANDIDATES:
+        path = os.path.join(test_dir, c)
+        if os.path.isfile(path):
+            audit = path
             break
     if audit:
-        audit_content = audit.read_text(encoding="utf-8")
-        audit_numbers = [int(n) for n in re.findall(r'\b(\d+)\b', audit_content)]
+        audit_content = snap.text(audit)
 
         # Check organized total
-        if actual_total in audit_numbers:
+        if mentions_number(audit_content, actual_total):
             print(f"  [PASS] Audit organized count ({actual_total}) matches actual")
         else:
             print(f"  [FAIL] Audit doesn't contain actual organized count {actual_total}")
             all_ok = False
 
         # Check quarantine count
-        if actual_quarantine in audit_numbers:
+        if mentions_number(audit_content, actual_quarantine):
             print(f"  [PASS] Audit quarantine count ({actual_quarantine}) matches actual")
         else:
             print(f"  [WARN] Audit quarantine count may not match actual ({actual_quarantine})")
@@ -586,7 +732,9 @@ def verify_cross_consistency(test_dir: Path) -> bool:
 # Main
 # ============================================================
 def main():
-    test_dir = get_test_directory()
+    # Paths are joined as plain strings below; Path stays at the entry point
+    test_dir = str(get_test_directory())
+    snap.clear()
     print(f"Test directory: {test_dir}")
 
     verification_steps = [
@@ -611,36 +759,41 @@ def main():
     results = []
 
     for step_name, verify_func in verification_steps:
-        print(f"\n{'='*58}")
-        print(f"  {step_name}")
-        print(f"{'='*58}")
-        try:
-            passed = verify_func(test_dir)
-            results.append((step_name, passed))
-            if not passed:
-                all_passed = False
-        except Exception as e:
-            print(f"  [ERROR] Exception: {e}")
-            results.append((step_name, False))
+        # Each step's diagnostics are collected and written to stdout in one go
+        out = io.StringIO()
+        with redirect_stdout(out):
+            print(f"\n{'='*58}")
+            print(f"  {step_name}")
+            print(f"{'='*58}")
+            try:
+                passed = verify_func(test_dir)
+            except Exception as e:
+                print(f"  [ERROR] Exception: {e}")
+                passed = False
+        sys.stdout.write(out.getvalue())
+        results.append((step_name, passed))
+        if not passed:
             all_passed = False
 
-    print(f"\n{'='*58}")
-    print("  VERIFICATION SUMMARY")
-    print(f"{'='*58}")
+    summary = [
+        f"\n{'='*58}",
+        "  VERIFICATION SUMMARY",
+        f"{'='*58}",
+    ]
     for step_name, passed in results:
         status = "PASS" if passed else "FAIL"
-        print(f"  [{status}] {step_name}")
+        summary.append(f"  [{status}] {step_name}")
 
     passed_count = sum(1 for _, p in results if p)
     total_count = len(results)
-    print(f"\n  Result: {passed_count}/{total_count} steps passed")
+    summary.append(f"\n  Result: {passed_count}/{total_count} steps passed")
 
     if all_passed:
-        print("\n  OVERALL: ALL CHECKS PASSED")
-        sys.exit(0)
+        summary.append("\n  OVERALL: ALL CHECKS PASSED")
     else:
-        print("\n  OVERALL: SOME CHECKS FAILED")
-        sys.exit(1)
+        summary.append("\n  OVERALL: SOME CHECKS FAILED")
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.exit(0 if all_passed else 1)
 
 
 if __name__ == "__main__":
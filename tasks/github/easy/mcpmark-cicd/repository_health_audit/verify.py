@@ -8,24 +8,32 @@ Verification for Repository Health Audit & Remediation v3 (GitHub MCP)
 import sys
 import os
 import re
-
-try:
-    from github import Github
-except ImportError:
-    print("PyGithub not installed, trying requests fallback")
-    Github = None
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+
+_ENV_LOADED = False
 
-try:
-    from dotenv import load_dotenv
+
+def load_env():
+    """Load .mcp_env into the environment on first use, at most once."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
     load_dotenv(".mcp_env")
-except ImportError:
-    pass
 
 
 def get_github_client():
     """Get GitHub API client."""
+    load_env()
     token = os.environ.get("MCP_GITHUB_TOKEN") or os.environ.get("GITHUB_TOKEN") or os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN")
     if not token:
         raise ValueError("MCP_GITHUB_TOKEN or GITHUB_TOKEN required")
@@ -34,6 +42,7 @@ def get_github_client():
 
 def get_repo_info():
     """Get repository owner and name from GITHUB_EVAL_ORG + hardcoded repo name."""
+    load_env()
     repo_full = os.environ.get("GITHUB_REPOSITORY")
     if repo_full:
         parts = repo_full.split("/")
@@ -45,29 +54,36 @@ def get_repo_info():
     raise ValueError("GITHUB_REPOSITORY or GITHUB_EVAL_ORG env var required")
 
 
+# One pooled keep-alive session for every API call, so the TLS handshake is
+# paid once per run instead of once per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_SESSION.headers.update({
+    "Accept": "application/vnd.github.v3+json",
+    "Accept-Encoding": "gzip",
+})
+
+
+def gh_get(url, token):
+    """GET an API URL on the shared session."""
+    return _SESSION.get(url, headers={"Authorization": f"token {token}"})
+
+
 def gh_api(endpoint, token):
     """Make a GitHub API request."""
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
     url = f"https://api.github.com{endpoint}"
-    resp = requests.get(url, headers=headers)
+    resp = gh_get(url, token)
     resp.raise_for_status()
     return resp.json()
 
 
 def gh_api_list(endpoint, token):
     """Make paginated GitHub API request."""
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
     results = []
     page = 1
     while True:
         url = f"https://api.github.com{endpoint}{'&' if '?' in endpoint else '?'}page={page}&per_page=100"
-        resp = requests.get(url, headers=headers)
+        resp = gh_get(url, token)
         resp.raise_for_status()
         data = resp.json()
         if not data:
@@ -79,11 +95,36 @@ def gh_api_list(endpoint, token):
     return results
 
 
+# Listing endpoints read by several steps are fetched once per run and shared.
+@lru_cache(maxsize=None)
+def get_labels(token, owner, repo):
+    return tuple(gh_api_list(f"/repos/{owner}/{repo}/labels", token))
+
+
+@lru_cache(maxsize=None)
+def get_open_issues(token, owner, repo):
+    """Open issues with pull requests filtered out."""
+    issues = gh_api_list(f"/repos/{owner}/{repo}/issues?state=open&per_page=100", token)
+    return tuple(i for i in issues if "pull_request" not in i)
+
+
+@lru_cache(maxsize=None)
+def get_pulls(token, owner, repo):
+    return tuple(gh_api_list(f"/repos/{owner}/{repo}/pulls?state=all&per_page=100", token))
+
+
+def prefetch(token, owner, repo):
+    """Warm the listing caches concurrently; failures resurface in their step."""
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        for fetch in (get_labels, get_open_issues, get_pulls):
+            ex.submit(fetch, token, owner, repo)
+
+
 # ============================================================
 # Step 1: Labels (8 required)
 # ============================================================
 def verify_labels(token, owner, repo) -> bool:
-    labels = gh_api_list(f"/repos/{owner}/{repo}/labels", token)
+    labels = get_labels(token, owner, repo)
     label_names = {l["name"] for l in labels}
 
     required = [
@@ -111,8 +152,7 @@ def verify_labels(token, owner, repo) -> bool:
 # Step 2: Issue count (6 total: 5 audit + 1 summary)
 # ============================================================
 def verify_issue_count(token, owner, repo) -> bool:
-    issues = gh_api_list(f"/repos/{owner}/{repo}/issues?state=open&per_page=100", token)
-    real_issues = [i for i in issues if "pull_request" not in i]
+    real_issues = get_open_issues(token, owner, repo)
 
     if len(real_issues) >= 6:
         print(f"  [PASS] At least 6 issues found ({len(real_issues)} total)")
@@ -126,8 +166,7 @@ def verify_issue_count(token, owner, repo) -> bool:
 # Step 3: Issue labels correct
 # ============================================================
 def verify_issue_labels(token, owner, repo) -> bool:
-    issues = gh_api_list(f"/repos/{owner}/{repo}/issues?state=open&per_page=100", token)
-    real_issues = [i for i in issues if "pull_request" not in i]
+    real_issues = get_open_issues(token, owner, repo)
 
     audit_labels_found = set()
     for issue in real_issues:
@@ -167,7 +206,7 @@ def verify_branch(token, owner, repo) -> bool:
 # Step 5: PR exists (title check only, no issue-reference requirement)
 # ============================================================
 def verify_pr(token, owner, repo) -> bool:
-    prs = gh_api_list(f"/repos/{owner}/{repo}/pulls?state=all&per_page=100", token)
+    prs = get_pulls(token, owner, repo)
 
     for pr in prs:
         title = pr.get("title", "").lower()
@@ -189,12 +228,8 @@ def verify_files_on_branch(token, owner, repo) -> bool:
 
     for filename in required_files:
         try:
-            headers = {
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github.v3+json"
-            }
             url = f"https://api.github.com/repos/{owner}/{repo}/contents/{filename}?ref={branch}"
-            resp = requests.get(url, headers=headers)
+            resp = gh_get(url, token)
             if resp.status_code == 200:
                 print(f"    [PASS] {filename} exists on branch")
             else:
@@ -210,9 +245,12 @@ def verify_files_on_branch(token, owner, repo) -> bool:
 # ============================================================
 # Step 7: Summary issue cross-references
 # ============================================================
+ASSESSMENT_RE = re.compile(r"assessment|overall", re.IGNORECASE)
+NEXT_STEPS_RE = re.compile(r"next step", re.IGNORECASE)
+
+
 def verify_summary_issue(token, owner, repo) -> bool:
-    issues = gh_api_list(f"/repos/{owner}/{repo}/issues?state=open&per_page=100", token)
-    real_issues = [i for i in issues if "pull_request" not in i]
+    real_issues = get_open_issues(token, owner, repo)
 
     summary = None
     for issue in real_issues:
@@ -237,14 +275,13 @@ def verify_summary_issue(token, owner, repo) -> bool:
         print(f"  [FAIL] Summary only references {len(unique_refs)} unique items (expected >= 5)")
         all_ok = False
 
-    body_lower = body.lower()
-    if "assessment" in body_lower or "overall" in body_lower:
+    if ASSESSMENT_RE.search(body):
         print("  [PASS] Summary contains assessment section")
     else:
         print("  [FAIL] Summary missing 'Overall Assessment' section")
         all_ok = False
 
-    if "next steps" in body_lower or "next step" in body_lower:
+    if NEXT_STEPS_RE.search(body):
         print("  [PASS] Summary contains next steps")
     else:
         print("  [FAIL] Summary missing 'Next Steps' section")
@@ -256,23 +293,26 @@ def verify_summary_issue(token, owner, repo) -> bool:
 # ============================================================
 # Step 8: Comments on audit issues
 # ============================================================
+COMMENT_KEYWORDS_RE = re.compile(r"priority|timeline|remediation", re.IGNORECASE)
+
+
 def verify_comments(token, owner, repo) -> bool:
-    issues = gh_api_list(f"/repos/{owner}/{repo}/issues?state=open&per_page=100", token)
-    real_issues = [i for i in issues if "pull_request" not in i]
+    real_issues = get_open_issues(token, owner, repo)
 
     audit_issues = [i for i in real_issues
                     if "summary" not in i.get("title", "").lower()]
 
+    # The per-issue comment fetches are independent; run them concurrently
+    endpoints = [f"/repos/{owner}/{repo}/issues/{i['number']}/comments" for i in audit_issues[:5]]
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        comment_lists = list(ex.map(lambda ep: gh_api_list(ep, token), endpoints))
+
     issues_with_comments = 0
-    for issue in audit_issues[:5]:
-        comments = gh_api_list(
-            f"/repos/{owner}/{repo}/issues/{issue['number']}/comments",
-            get_github_client()
-        )
+    for comments in comment_lists:
         if len(comments) >= 1:
             for c in comments:
-                body = (c.get("body", "") or "").lower()
-                if len(body) >= 50 and any(kw in body for kw in ["priority", "timeline", "remediation"]):
+                body = c.get("body", "") or ""
+                if len(body) >= 50 and COMMENT_KEYWORDS_RE.search(body):
                     issues_with_comments += 1
                     break
 
@@ -290,16 +330,14 @@ def verify_comments(token, owner, repo) -> bool:
 # ============================================================
 # Step 9: LICENSE file content check
 # ============================================================
+MIT_RE = re.compile(r"mit|permission is hereby granted", re.IGNORECASE)
+
+
 def verify_license_content(token, owner, repo) -> bool:
     branch = "audit/health-check-remediation"
     try:
-        import base64
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/LICENSE?ref={branch}"
-        resp = requests.get(url, headers=headers)
+        resp = gh_get(url, token)
         if resp.status_code != 200:
             print("  [FAIL] LICENSE file not accessible")
             return False
@@ -308,7 +346,7 @@ def verify_license_content(token, owner, repo) -> bool:
         content = base64.b64decode(data.get("content", "")).decode("utf-8", errors="replace")
 
         all_ok = True
-        if "mit" in content.lower() or "permission is hereby granted" in content.lower():
+        if MIT_RE.search(content):
             print("  [PASS] LICENSE contains MIT license text")
         else:
             print("  [FAIL] LICENSE does not contain MIT license text")
@@ -334,6 +372,7 @@ def main():
     owner, repo = get_repo_info()
 
     print(f"Verifying repository: {owner}/{repo}")
+    prefetch(token, owner, repo)
 
     verification_steps = [
         ("Step 1: Labels (8 required)", lambda: verify_labels(token, owner, repo)),
@@ -10,8 +10,19 @@ import sys
 import json
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 # =============================================================================
@@ -19,6 +30,52 @@ from typing import Dict, Optional, Tuple
 # =============================================================================
 
 
+def load_json_file(path: str):
+    """Parse a JSON file from its raw bytes, with orjson when it is installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+if msgspec is not None:
+
+    class Message(msgspec.Struct):
+        """The fields the answer search reads; content is left undecoded."""
+
+        role: Any = None
+        content: msgspec.Raw = msgspec.Raw(b"[]")
+
+    _MESSAGES_DECODER = msgspec.json.Decoder(List[Message])
+
+
+def assistant_contents(path: str) -> Iterator[Any]:
+    """Yield the content of each assistant message, newest first.
+
+    With msgspec installed the file is decoded against a typed schema and
+    only assistant contents are turned into Python objects, one at a time
+    as the caller asks for them. A file that does not fit the schema (or is
+    not valid JSON) goes through load_json_file() instead.
+    """
+    if msgspec is not None:
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            messages = _MESSAGES_DECODER.decode(data)
+        except msgspec.DecodeError:
+            pass
+        else:
+            for message in reversed(messages):
+                if message.role == "assistant":
+                    yield msgspec.json.decode(message.content)
+            return
+
+    for message in reversed(load_json_file(path)):
+        if message.get("role") == "assistant":
+            yield message.get("content", [])
+
+
 def get_model_response() -> Optional[str]:
     messages_path = os.getenv("MCP_MESSAGES")
     print(f"| MCP_MESSAGES: {messages_path}")
@@ -27,49 +84,26 @@ def get_model_response() -> Optional[str]:
         return None
 
     try:
-        with open(messages_path, "r") as f:
-            messages = json.load(f)
-
-        for message in reversed(messages):
-            if message.get("role") == "assistant":
-                content = message.get("content", [])
-                if isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict) and item.get("type") in [
-                            "text",
-                            "output_text",
-                        ]:
-                            text = item.get("text", "")
-                            if "<answer>" in text:
-                                return text
-                    all_text = " ".join(
-                        item.get("text", "")
-                        if isinstance(item, dict)
-                        else str(item)
-                        for item in content
-                    )
-                    if "<answer>" in all_text:
-                        return all_text
-                elif isinstance(content, str):
-                    if "<answer>" in content:
-                        return content
-
-        for message in reversed(messages):
-            if message.get("role") == "assistant":
-                content = message.get("content", [])
-                if isinstance(content, list):
-                    full_text = " ".join(
-                        item.get("text", "")
-                        if isinstance(item, dict)
-                        else str(item)
-                        for item in content
-                    )
-                elif isinstance(content, str):
-                    full_text = content
-                else:
-                    continue
-                if "<answer>" in full_text:
-                    return full_text
+        # One reverse pass: a text item holding the tag wins; otherwise the
+        # joined content is returned, built only when some piece has the tag
+        for content in assistant_contents(messages_path):
+            if isinstance(content, str):
+                if "<answer>" in content:
+                    return content
+            elif isinstance(content, list):
+                pieces = []
+                tagged = False
+                for item in content:
+                    if isinstance(item, dict):
+                        text = item.get("text", "")
+                        if item.get("type") in ("text", "output_text") and "<answer>" in text:
+                            return text
+                    else:
+                        text = str(item)
+                    pieces.append(text)
+                    tagged = tagged or "<answer>" in text
+                if tagged:
+                    return " ".join(pieces)
 
         print(
             "| Warning: No assistant message with <answer> tag found", file=sys.stderr
@@ -84,42 +118,66 @@ def get_model_response() -> Optional[str]:
 # ANSWER PARSING
 # =============================================================================
 
+ANSWER_OPEN = "<answer>"
+ANSWER_CLOSE = "</answer>"
+_ANSWER_RE = re.compile(r"<answer>(.*?)</answer>", re.IGNORECASE | re.DOTALL)
+
+
+def find_answer_body(text: str) -> Optional[str]:
+    """Return the text between the first <answer> and the next </answer>.
+
+    Tags match case-insensitively. The tags are located with str.find on a
+    casefolded copy; the regex is only used when casefolding changes the
+    length of the text (e.g. "ß" -> "ss"), since offsets no longer line up.
+    """
+    folded = text.casefold()
+    if len(folded) != len(text):
+        match = _ANSWER_RE.search(text)
+        return match.group(1) if match else None
+
+    start = folded.find(ANSWER_OPEN)
+    if start < 0:
+        return None
+    start += len(ANSWER_OPEN)
+    end = folded.find(ANSWER_CLOSE, start)
+    if end < 0:
+        return None
+    return text[start:end]
+
+
+def parse_fields(content: str) -> Dict[str, str]:
+    """Parse "Key|Value" lines; lines without a "|" are skipped."""
+    result = {}
+    for line in content.splitlines():
+        key, sep, value = line.partition("|")
+        if sep:
+            result[key.strip()] = value.strip()
+    return result
+
 
 def parse_answer_format(text: str) -> Optional[Dict[str, str]]:
     if not text:
         return None
 
-    match = re.search(r"<answer>(.*?)</answer>", text, re.IGNORECASE | re.DOTALL)
-    if not match:
+    body = find_answer_body(text)
+    if body is None:
         return None
 
-    answer_content = match.group(1).strip()
-    result = {}
+    return parse_fields(body)
 
-    for line in answer_content.split("\n"):
-        line = line.strip()
-        if not line or "|" not in line:
-            continue
-        key, value = line.split("|", 1)
-        result[key.strip()] = value.strip()
 
-    return result
+@lru_cache(maxsize=16)
+def _load_expected_cached(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Read and parse a label file; the stat fields only key the cache."""
+    with open(path, "r") as f:
+        return parse_fields(f.read())
 
 
 def load_expected_answer(label_path: Path) -> Optional[Dict[str, str]]:
     try:
-        with open(label_path, "r") as f:
-            lines = f.read().strip().split("\n")
-
-        expected = {}
-        for line in lines:
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-            key, value = line.split("|", 1)
-            expected[key.strip()] = value.strip()
-
-        return expected
+        # Re-invocations in one process reuse the parse until the file changes
+        st = os.stat(label_path)
+        return dict(_load_expected_cached(str(label_path), st.st_mtime_ns, st.st_size))
     except Exception as e:
         print(f"| Error reading label file: {str(e)}", file=sys.stderr)
         return None
@@ -145,9 +203,11 @@ def compare_exact_ci(model_val: str, expected_val: str, field: str) -> Tuple[boo
 def compare_contains(
     model_val: str, expected_val: str, field: str
 ) -> Tuple[bool, str]:
-    if expected_val.lower() in model_val.lower():
+    m = model_val.casefold()
+    e = expected_val.casefold()
+    if e in m:
         return True, f"✓ {field}: contains expected content"
-    if model_val.lower() in expected_val.lower():
+    if m in e:
         return True, f"✓ {field}: contained in expected content"
     return False, f"✗ {field}: expected to contain '{expected_val}', got '{model_val}'"
 
@@ -168,6 +228,10 @@ def compare_number(
         return False, f"✗ {field}: could not parse as number: '{model_val}'"
 
 
+# Dependency-name normalization: underscores become hyphens, spaces are dropped
+_NORM_TABLE = str.maketrans({"_": "-", " ": None})
+
+
 def compare_dep_list(
     model_val: str, expected_val: str, field: str
 ) -> Tuple[bool, str]:
@@ -178,10 +242,10 @@ def compare_dep_list(
     - Require at least N-1 of expected dependencies
     """
     def normalize(name: str) -> str:
-        return name.strip().lower().replace("_", "-").replace(" ", "")
+        return name.strip().casefold().translate(_NORM_TABLE)
 
-    model_deps = set(normalize(d) for d in model_val.split(",") if d.strip())
-    expected_deps = set(normalize(d) for d in expected_val.split(",") if d.strip())
+    model_deps = frozenset(normalize(d) for d in model_val.split(",") if d.strip())
+    expected_deps = frozenset(normalize(d) for d in expected_val.split(",") if d.strip())
 
     found = model_deps & expected_deps
     missing = expected_deps - model_deps
@@ -240,7 +304,7 @@ FIELD_COMPARATORS = {
     "SharedTransitiveDep": compare_exact_ci,
 }
 
-REQUIRED_FIELDS = ["FlaskDeps", "SharedTransitiveDep"]
+REQUIRED_FIELDS = frozenset({"FlaskDeps", "SharedTransitiveDep"})
 
 # All fields must pass for the task to pass (MCPMark convention)
 
@@ -277,19 +341,25 @@ def verify() -> bool:
     print(f"| Parsed {len(model_answer)} fields from model answer")
     print("| " + "-" * 60)
 
-    for field in REQUIRED_FIELDS:
-        if field not in model_answer:
-            print(
-                f"| FAIL: Required field '{field}' missing from model answer",
-                file=sys.stderr,
-            )
-            return False
+    missing_required = REQUIRED_FIELDS - model_answer.keys()
+    if missing_required:
+        print(
+            f"| FAIL: Required field(s) missing from model answer: {sorted(missing_required)}",
+            file=sys.stderr,
+        )
+        return False
 
     total_fields = len(expected)
     passed_fields = 0
     results = []
 
-    for field, expected_val in expected.items():
+    # Comparators are resolved once per field, before the comparison loop
+    plan = [
+        (field, expected_val, FIELD_COMPARATORS.get(field, compare_exact))
+        for field, expected_val in expected.items()
+    ]
+
+    for field, expected_val, comparator in plan:
         model_val = model_answer.get(field, "")
 
         if not model_val:
@@ -297,7 +367,6 @@ def verify() -> bool:
             results.append((False, result_msg))
             continue
 
-        comparator = FIELD_COMPARATORS.get(field, compare_exact)
         passed, msg = comparator(model_val, expected_val, field)
 
         results.append((passed, msg))
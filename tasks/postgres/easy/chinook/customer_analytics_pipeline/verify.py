@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Verification for Customer Analytics & Genre Rankings (PostgreSQL MCP)
-12 checks covering materialized view, tables, function, trigger, indexes.
+11 checks covering materialized view, tables, function, trigger, indexes.
 
 Uses the Chinook database (59 customers, 412 invoices, 2240 invoice lines).
 Ground truth is computed from the live database to avoid hardcoding.
@@ -9,12 +9,66 @@ Ground truth is computed from the live database to avoid hardcoding.
 
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import psycopg2
 import psycopg2.extras
 
 
-def get_conn():
-    """Get a database connection."""
+# The larger queries, kept out of the step bodies so they can be read
+# (and reused) on their own
+_SQL_CATALOG = """
+    SELECT c.relkind::text AS kind, c.relname::text AS name, NULL::text AS attname
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'v', 'm')
+    UNION ALL
+    SELECT 'cols', c.relname::text, a.attname::text FROM pg_attribute a
+    JOIN pg_class c ON c.oid = a.attrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'v', 'm')
+      AND a.attnum > 0 AND NOT a.attisdropped
+    UNION ALL
+    SELECT 'proc', p.proname::text, NULL FROM pg_proc p
+    JOIN pg_namespace n ON n.oid = p.pronamespace
+    WHERE n.nspname = 'public'
+    UNION ALL
+    SELECT 'trig', c.relname::text, NULL FROM pg_trigger t
+    JOIN pg_class c ON c.oid = t.tgrelid
+    WHERE NOT t.tgisinternal
+    UNION ALL
+    SELECT 'idx', indexname::text, NULL FROM pg_indexes
+"""
+
+_SQL_CUSTOMER_TRIGGER_FUNC = """
+    SELECT p.proname FROM pg_proc p
+    JOIN pg_namespace n ON n.oid = p.pronamespace
+    JOIN pg_trigger t ON t.tgfoid = p.oid
+    JOIN pg_class c ON c.oid = t.tgrelid
+    WHERE c.relname = 'Customer' AND n.nspname = 'public'
+"""
+
+_SQL_TRIGGER_PROBE = """
+    SET CONSTRAINTS ALL IMMEDIATE;
+    DELETE FROM "Customer" WHERE "CustomerId" = 99998;
+    DELETE FROM customer_audit_log WHERE customer_id = 99998;
+    INSERT INTO "Customer" ("CustomerId", "FirstName", "LastName", "Email")
+    VALUES (99998, 'Test', 'Verify', 'test.verify@example.com');
+    UPDATE "Customer" SET "FirstName" = 'TestUpdated'
+    WHERE "CustomerId" = 99998;
+    DELETE FROM "Customer" WHERE "CustomerId" = 99998;
+    WITH cleared AS (
+        DELETE FROM customer_audit_log WHERE customer_id = 99998
+        RETURNING action
+    )
+    SELECT array_agg(action::text) FROM cleared
+"""
+
+
+def get_conn_params():
+    """Get database connection parameters."""
     params = {
         "host": os.getenv("POSTGRES_HOST", "localhost"),
         "port": int(os.getenv("POSTGRES_PORT", 5432)),
@@ -24,11 +78,86 @@ def get_conn():
     }
     if not params["database"]:
         raise ValueError("POSTGRES_DATABASE env var required")
-    return psycopg2.connect(**params)
+    return params
+
+
+class StepOutput:
+    """sys.stdout stand-in that gives each worker thread its own buffer.
+
+    Steps run concurrently but keep using print(); whatever a thread prints
+    while capturing is collected and written out later in step order.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
 
+    def write(self, s):
+        buf = getattr(self.local, "buf", None)
+        return (self.stream if buf is None else buf).write(s)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, func, *args):
+        """Run func(*args) with this thread's prints captured; return (result, text)."""
+        self.local.buf = io.StringIO()
+        try:
+            return func(*args), self.local.buf.getvalue()
+        finally:
+            self.local.buf = None
+
+
+class ThreadConnections:
+    """Connection pool holding one autocommit connection per worker thread.
+
+    psycopg2's ThreadedConnectionPool opens connections while holding its
+    lock, so workers would connect one after another; here each worker
+    opens its own connection concurrently on first use and keeps it for
+    the steps it runs next.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.conns = []
+
+    def get(self, readonly):
+        """This thread's connection, switched to the requested access mode."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = psycopg2.connect(**self.params)
+            conn.autocommit = True
+            with self.lock:
+                self.conns.append(conn)
+            self.local.conn = conn
+            self.local.readonly = None
+        # In autocommit mode set_session() issues a SET, so only on a change
+        if self.local.readonly != readonly:
+            conn.set_session(readonly=readonly)
+            self.local.readonly = readonly
+        return conn
+
+    def closeall(self):
+        with self.lock:
+            for conn in self.conns:
+                conn.close()
+            self.conns.clear()
+
+
+# Queries are sent unprepared on purpose: after batching, every statement
+# runs at most once per connection, so a PREPARE would add a round-trip
+# without ever saving a parse/plan.
+def run_rows(conn, sql, params=None):
+    """Run a query and return rows as plain tuples."""
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        return cur.fetchall()
 
-def run_query(conn, sql, params=None):
-    """Run a query and return results."""
+
+def run_dicts(conn, sql, params=None):
+    """Run a query and return rows as dicts keyed by column name."""
     with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
         cur.execute(sql, params)
         return cur.fetchall()
@@ -42,16 +171,45 @@ def run_scalar(conn, sql, params=None):
         return row[0] if row else None
 
 
+# Catalog snapshot shared by all steps: relation names by relkind ('r', 'v',
+# 'm'), column names per relation ('cols'), public function names ('proc'),
+# tables carrying user triggers ('trig') and index names in any schema ('idx').
+# main() prefetches it once before the steps start.
+_catalog = {}
+
+
+def load_catalog(conn):
+    """Load the catalog names the existence checks need in one round-trip."""
+    catalog = {'r': set(), 'v': set(), 'm': set(), 'cols': {}, 'proc': set(),
+               'trig': set(), 'idx': set()}
+    rows = run_rows(conn, _SQL_CATALOG)
+    for kind, name, attname in rows:
+        if kind == 'cols':
+            catalog['cols'].setdefault(name, set()).add(attname)
+        else:
+            catalog[kind].add(name)
+    _catalog.update(catalog)
+
+
+def get_catalog(conn):
+    """The shared catalog snapshot, loaded on first use if main() has not."""
+    if not _catalog:
+        load_catalog(conn)
+    return _catalog
+
+
 def check_relation_exists(conn, name, relkind='r'):
     """Check if a relation (table/view/matview) exists."""
-    kind_map = {'r': 'table', 'v': 'view', 'm': 'materialized view'}
-    sql = """
-        SELECT 1 FROM pg_class c 
-        JOIN pg_namespace n ON n.oid = c.relnamespace
-        WHERE c.relname = %s AND c.relkind = %s AND n.nspname = 'public'
+    return name in get_catalog(conn)[relkind]
+
+
+def get_columns(conn, table):
+    """Column names of a public table, view or matview; empty if it does not exist.
+
+    Read from pg_attribute via the catalog snapshot rather than by fetching
+    a sample row; information_schema.columns would miss materialized views.
     """
-    result = run_scalar(conn, sql, (name, relkind))
-    return result is not None
+    return get_catalog(conn)['cols'].get(table, set())
 
 
 # ============================================================
@@ -75,11 +233,15 @@ def verify_matview_exists(conn) -> bool:
 def verify_matview_data(conn) -> bool:
     all_ok = True
 
-    # Check columns exist
+    # Row count and the expected revenue in one round-trip
     try:
-        rows = run_query(conn, "SELECT * FROM monthly_revenue LIMIT 1")
-        if rows:
-            cols = set(rows[0].keys())
+        count, expected_total = run_rows(conn, """
+            SELECT
+                (SELECT COUNT(*) FROM monthly_revenue),
+                (SELECT ROUND(SUM("Total")::numeric, 2) FROM "Invoice")
+        """)[0]
+        if count:
+            cols = get_columns(conn, 'monthly_revenue')
             required_cols = {'sale_year', 'sale_month', 'country', 'total_revenue', 'invoice_count', 'avg_invoice'}
             missing = required_cols - cols
             if missing:
@@ -93,8 +255,8 @@ def verify_matview_data(conn) -> bool:
         print(f"  [FAIL] Cannot query monthly_revenue: {e}")
         return False
 
-    # Spot-check: total revenue should match Invoice table
-    expected_total = run_scalar(conn, 'SELECT ROUND(SUM("Total")::numeric, 2) FROM "Invoice"')
+    # Spot-check: total revenue should match Invoice table. Only summed once
+    # the column is known to exist, so it cannot share the query above.
     actual_total = run_scalar(conn, "SELECT ROUND(SUM(total_revenue)::numeric, 2) FROM monthly_revenue")
 
     if expected_total and actual_total and abs(float(expected_total) - float(actual_total)) < 0.02:
@@ -104,7 +266,6 @@ def verify_matview_data(conn) -> bool:
         all_ok = False
 
     # Check row count > 0
-    count = run_scalar(conn, "SELECT COUNT(*) FROM monthly_revenue")
     if count and count > 0:
         print(f"  [PASS] monthly_revenue has {count} rows")
     else:
@@ -123,9 +284,8 @@ def verify_customer_analytics_exists(conn) -> bool:
         return False
 
     try:
-        rows = run_query(conn, "SELECT * FROM customer_analytics LIMIT 1")
-        if rows:
-            cols = set(rows[0].keys())
+        if run_scalar(conn, "SELECT EXISTS (SELECT 1 FROM customer_analytics)"):
+            cols = get_columns(conn, 'customer_analytics')
             required = {'customer_id', 'full_name', 'email', 'country', 'total_spent',
                         'num_purchases', 'avg_purchase', 'first_purchase', 'last_purchase',
                         'customer_segment'}
@@ -149,19 +309,10 @@ def verify_customer_analytics_exists(conn) -> bool:
 def verify_customer_segments(conn) -> bool:
     all_ok = True
 
-    # Count customers in each segment
-    segments = run_query(conn, """
-        SELECT customer_segment, COUNT(*) as cnt 
-        FROM customer_analytics 
-        GROUP BY customer_segment 
-        ORDER BY customer_segment
-    """)
-    seg_map = {s['customer_segment']: s['cnt'] for s in segments}
-
-    # Compute expected from Invoice table
-    expected = run_query(conn, """
-        SELECT segment, COUNT(*) as cnt
-        FROM (
+    # Actual and expected (from the Invoice table) segment counts plus both
+    # customer totals in one round-trip
+    counts = run_rows(conn, """
+        WITH expected_segments AS (
             SELECT 
                 CASE 
                     WHEN "Total" > 45.00 THEN 'VIP'
@@ -173,10 +324,20 @@ def verify_customer_segments(conn) -> bool:
                 FROM "Invoice"
                 GROUP BY "CustomerId"
             ) sub
-        ) seg_sub
-        GROUP BY segment
+        )
+        SELECT 'actual' as src, customer_segment::text as segment, COUNT(*) as cnt
+        FROM customer_analytics
+        GROUP BY customer_segment
+        UNION ALL
+        SELECT 'expected', segment, COUNT(*) FROM expected_segments GROUP BY segment
+        UNION ALL
+        SELECT 'total_actual', NULL, COUNT(*) FROM customer_analytics
+        UNION ALL
+        SELECT 'total_expected', NULL, COUNT(DISTINCT "CustomerId") FROM "Invoice"
     """)
-    expected_map = {e['segment']: e['cnt'] for e in expected}
+    seg_map = {seg: cnt for src, seg, cnt in counts if src == 'actual'}
+    expected_map = {seg: cnt for src, seg, cnt in counts if src == 'expected'}
+    totals = {src: cnt for src, _, cnt in counts if src.startswith('total_')}
 
     for seg in ['VIP', 'Regular', 'Occasional']:
         actual = seg_map.get(seg, 0)
@@ -188,8 +349,8 @@ def verify_customer_segments(conn) -> bool:
             all_ok = False
 
     # Check total count
-    total_actual = run_scalar(conn, "SELECT COUNT(*) FROM customer_analytics")
-    total_expected = run_scalar(conn, 'SELECT COUNT(DISTINCT "CustomerId") FROM "Invoice"')
+    total_actual = totals['total_actual']
+    total_expected = totals['total_expected']
     if total_actual == total_expected:
         print(f"    [PASS] Total customers: {total_actual}")
     else:
@@ -206,7 +367,7 @@ def verify_customer_values(conn) -> bool:
     all_ok = True
 
     # Pick customer 1 as test
-    expected = run_query(conn, """
+    expected = run_dicts(conn, """
         SELECT 
             "CustomerId" as cid,
             ROUND(SUM("Total")::numeric, 2) as total,
@@ -224,7 +385,7 @@ def verify_customer_values(conn) -> bool:
         return True
 
     exp = expected[0]
-    actual = run_query(conn, "SELECT * FROM customer_analytics WHERE customer_id = 1")
+    actual = run_dicts(conn, "SELECT * FROM customer_analytics WHERE customer_id = 1")
 
     if not actual:
         print("  [FAIL] Customer 1 not found in customer_analytics")
@@ -258,9 +419,8 @@ def verify_genre_rankings_exists(conn) -> bool:
         return False
 
     try:
-        rows = run_query(conn, "SELECT * FROM genre_country_rankings LIMIT 1")
-        if rows:
-            cols = set(rows[0].keys())
+        if run_scalar(conn, "SELECT EXISTS (SELECT 1 FROM genre_country_rankings)"):
+            cols = get_columns(conn, 'genre_country_rankings')
             required = {'country', 'genre_name', 'genre_revenue', 'country_rank'}
             missing = required - cols
             if missing:
@@ -300,13 +460,13 @@ def verify_genre_rankings_data(conn) -> bool:
         print(f"  [WARN] {actual_countries} countries in rankings vs {expected_countries} in Invoice")
 
     # Spot-check USA top genre
-    usa_top = run_query(conn, """
+    usa_top = run_rows(conn, """
         SELECT genre_name, genre_revenue FROM genre_country_rankings 
         WHERE country = 'USA' AND country_rank = 1
     """)
 
     # Compute expected
-    expected_usa_top = run_query(conn, """
+    expected_usa_top = run_rows(conn, """
         SELECT g."Name" as genre_name, 
                ROUND(SUM(il."UnitPrice" * il."Quantity")::numeric, 2) as revenue
         FROM "Invoice" i
@@ -320,10 +480,10 @@ def verify_genre_rankings_data(conn) -> bool:
     """)
 
     if usa_top and expected_usa_top:
-        if usa_top[0]['genre_name'] == expected_usa_top[0]['genre_name']:
-            print(f"  [PASS] USA top genre: {usa_top[0]['genre_name']}")
+        if usa_top[0][0] == expected_usa_top[0][0]:
+            print(f"  [PASS] USA top genre: {usa_top[0][0]}")
         else:
-            print(f"  [FAIL] USA top genre: got '{usa_top[0]['genre_name']}', expected '{expected_usa_top[0]['genre_name']}'")
+            print(f"  [FAIL] USA top genre: got '{usa_top[0][0]}', expected '{expected_usa_top[0][0]}'")
             all_ok = False
     elif not usa_top:
         print("  [FAIL] No USA data in genre_country_rankings")
@@ -336,12 +496,7 @@ def verify_genre_rankings_data(conn) -> bool:
 # Step 8: get_customer_top_genre function exists
 # ============================================================
 def verify_function_exists(conn) -> bool:
-    result = run_scalar(conn, """
-        SELECT 1 FROM pg_proc p
-        JOIN pg_namespace n ON n.oid = p.pronamespace
-        WHERE p.proname = 'get_customer_top_genre' AND n.nspname = 'public'
-    """)
-    if result:
+    if 'get_customer_top_genre' in get_catalog(conn)['proc']:
         print("  [PASS] Function 'get_customer_top_genre' exists")
         return True
     else:
@@ -355,28 +510,29 @@ def verify_function_exists(conn) -> bool:
 def verify_function_output(conn) -> bool:
     all_ok = True
 
-    # Test with customer 1
-    actual = run_scalar(conn, "SELECT get_customer_top_genre(1)")
-
-    # Compute expected
-    expected = run_scalar(conn, """
-        SELECT g."Name"
-        FROM "Invoice" i
-        JOIN "InvoiceLine" il ON il."InvoiceId" = i."InvoiceId"
-        JOIN "Track" t ON t."TrackId" = il."TrackId"
-        JOIN "Genre" g ON g."GenreId" = t."GenreId"
-        WHERE i."CustomerId" = 1
-        GROUP BY g."Name"
-        ORDER BY SUM(il."UnitPrice" * il."Quantity") DESC
-        LIMIT 1
-    """)
+    # Customer 1 result, its expected top genre and the non-existent customer
+    # (very high ID) result in one round-trip
+    actual, expected, no_purchase = run_rows(conn, """
+        SELECT
+            get_customer_top_genre(1),
+            (SELECT g."Name"
+             FROM "Invoice" i
+             JOIN "InvoiceLine" il ON il."InvoiceId" = i."InvoiceId"
+             JOIN "Track" t ON t."TrackId" = il."TrackId"
+             JOIN "Genre" g ON g."GenreId" = t."GenreId"
+             WHERE i."CustomerId" = 1
+             GROUP BY g."Name"
+             ORDER BY SUM(il."UnitPrice" * il."Quantity") DESC
+             LIMIT 1),
+            get_customer_top_genre(99999)
+    """)[0]
 
     if actual and expected:
         if actual == expected:
             print(f"    [PASS] Customer 1 top genre: '{actual}'")
         else:
             # Check if it's a valid tie
-            top_genres = run_query(conn, """
+            top_genres = run_rows(conn, """
                 SELECT g."Name", SUM(il."UnitPrice" * il."Quantity") as total
                 FROM "Invoice" i
                 JOIN "InvoiceLine" il ON il."InvoiceId" = i."InvoiceId"
@@ -387,14 +543,13 @@ def verify_function_output(conn) -> bool:
                 ORDER BY total DESC
                 LIMIT 2
             """)
-            if len(top_genres) >= 2 and float(top_genres[0]['total']) == float(top_genres[1]['total']):
+            if len(top_genres) >= 2 and float(top_genres[0][1]) == float(top_genres[1][1]):
                 print(f"    [PASS] Customer 1 top genre: '{actual}' (valid tie)")
             else:
                 print(f"    [FAIL] Customer 1 top genre: got '{actual}', expected '{expected}'")
                 all_ok = False
 
-    # Test edge case: non-existent customer (very high ID)
-    no_purchase = run_scalar(conn, "SELECT get_customer_top_genre(99999)")
+    # Test edge case: non-existent customer
     if no_purchase and 'no purchase' in no_purchase.lower():
         print(f"    [PASS] Non-existent customer returns: '{no_purchase}'")
     else:
@@ -405,7 +560,7 @@ def verify_function_output(conn) -> bool:
 
 
 # ============================================================
-# Step 10: Audit trigger exists
+# Step 10: Audit trigger exists and fires correctly
 # ============================================================
 def verify_trigger_exists(conn) -> bool:
     all_ok = True
@@ -418,35 +573,18 @@ def verify_trigger_exists(conn) -> bool:
         return False
 
     # Check trigger on Customer
-    trigger = run_scalar(conn, """
-        SELECT 1 FROM pg_trigger t
-        JOIN pg_class c ON c.oid = t.tgrelid
-        WHERE c.relname = 'Customer' AND NOT t.tgisinternal
-    """)
-
-    if trigger:
+    if 'Customer' in get_catalog(conn)['trig']:
         print("  [PASS] Trigger on Customer table exists")
     else:
         print("  [FAIL] No trigger found on Customer table")
         all_ok = False
 
     # Check trigger function
-    func = run_scalar(conn, """
-        SELECT 1 FROM pg_proc p
-        JOIN pg_namespace n ON n.oid = p.pronamespace
-        WHERE p.proname = 'fn_customer_audit' AND n.nspname = 'public'
-    """)
-    if func:
+    if 'fn_customer_audit' in get_catalog(conn)['proc']:
         print("  [PASS] Trigger function 'fn_customer_audit' exists")
     else:
         # Accept any audit-related function name
-        func2 = run_scalar(conn, """
-            SELECT p.proname FROM pg_proc p
-            JOIN pg_namespace n ON n.oid = p.pronamespace
-            JOIN pg_trigger t ON t.tgfoid = p.oid
-            JOIN pg_class c ON c.oid = t.tgrelid
-            WHERE c.relname = 'Customer' AND n.nspname = 'public'
-        """)
+        func2 = run_scalar(conn, _SQL_CUSTOMER_TRIGGER_FUNC)
         if func2:
             print(f"  [WARN] Found audit function '{func2}' (expected 'fn_customer_audit')")
         else:
@@ -456,73 +594,29 @@ def verify_trigger_exists(conn) -> bool:
     return all_ok
 
 
-# ============================================================
-# Step 11: Audit trigger fires correctly
-# ============================================================
 def verify_trigger_fires(conn) -> bool:
     all_ok = True
 
+    # The probe is one multi-statement batch: a single round-trip that runs
+    # as one implicit transaction. Each statement's triggers have fired before
+    # the next starts, and the final DELETE ... RETURNING reads the logged
+    # actions while cleaning them up. A leftover test customer is removed
+    # before the log is cleared, so its DELETE entry cannot count as ours.
+    # SET CONSTRAINTS ALL IMMEDIATE makes a DEFERRABLE INITIALLY DEFERRED
+    # constraint trigger fire per statement too, as it did when each
+    # statement committed on its own; otherwise it would only fire at the
+    # end of the batch, after the log was read. If any statement errors the
+    # whole batch rolls back, so only the error is reported, with no
+    # per-action lines.
     try:
-        # Clear any previous test data
-        with conn.cursor() as cur:
-            cur.execute("DELETE FROM customer_audit_log WHERE customer_id = 99998")
-            cur.execute("""
-                DELETE FROM "Customer" WHERE "CustomerId" = 99998
-            """)
-
-        # INSERT test
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO "Customer" ("CustomerId", "FirstName", "LastName", "Email")
-                VALUES (99998, 'Test', 'Verify', 'test.verify@example.com')
-            """)
-
-        insert_log = run_query(conn, """
-            SELECT action, customer_id, new_data FROM customer_audit_log 
-            WHERE customer_id = 99998 AND action = 'INSERT'
-        """)
-        if insert_log:
-            print("    [PASS] INSERT trigger fired")
-        else:
-            print("    [FAIL] INSERT trigger did not fire")
-            all_ok = False
+        logged = run_scalar(conn, _SQL_TRIGGER_PROBE) or []
 
-        # UPDATE test
-        with conn.cursor() as cur:
-            cur.execute("""
-                UPDATE "Customer" SET "FirstName" = 'TestUpdated'
-                WHERE "CustomerId" = 99998
-            """)
-
-        update_log = run_query(conn, """
-            SELECT action FROM customer_audit_log 
-            WHERE customer_id = 99998 AND action = 'UPDATE'
-        """)
-        if update_log:
-            print("    [PASS] UPDATE trigger fired")
-        else:
-            print("    [FAIL] UPDATE trigger did not fire")
-            all_ok = False
-
-        # DELETE test
-        with conn.cursor() as cur:
-            cur.execute("""
-                DELETE FROM "Customer" WHERE "CustomerId" = 99998
-            """)
-
-        delete_log = run_query(conn, """
-            SELECT action FROM customer_audit_log 
-            WHERE customer_id = 99998 AND action = 'DELETE'
-        """)
-        if delete_log:
-            print("    [PASS] DELETE trigger fired")
-        else:
-            print("    [FAIL] DELETE trigger did not fire")
-            all_ok = False
-
-        # Cleanup
-        with conn.cursor() as cur:
-            cur.execute("DELETE FROM customer_audit_log WHERE customer_id = 99998")
+        for action in ("INSERT", "UPDATE", "DELETE"):
+            if action in logged:
+                print(f"    [PASS] {action} trigger fired")
+            else:
+                print(f"    [FAIL] {action} trigger did not fire")
+                all_ok = False
 
     except Exception as e:
         print(f"    [FAIL] Trigger test error: {e}")
@@ -531,23 +625,35 @@ def verify_trigger_fires(conn) -> bool:
     return all_ok
 
 
+def verify_audit_trigger(conn) -> bool:
+    """Catalog checks, then the firing probe on the same connection.
+
+    Without the audit table there is nothing to probe, so the DML batch
+    is only sent once the table is known to exist.
+    """
+    exists_ok = verify_trigger_exists(conn)
+    if not check_relation_exists(conn, 'customer_audit_log', 'r'):
+        return False
+    fires_ok = verify_trigger_fires(conn)
+    return exists_ok and fires_ok
+
+
 # ============================================================
-# Step 12: Indexes exist
+# Step 11: Indexes exist
 # ============================================================
+REQUIRED_INDEXES = (
+    "idx_invoice_customer",
+    "idx_invoiceline_track",
+    "idx_customer_analytics_segment",
+    "idx_genre_country_rank",
+)
+
+
 def verify_indexes(conn) -> bool:
     all_ok = True
-    required_indexes = [
-        "idx_invoice_customer",
-        "idx_invoiceline_track",
-        "idx_customer_analytics_segment",
-        "idx_genre_country_rank",
-    ]
-
-    for idx_name in required_indexes:
-        exists = run_scalar(conn, """
-            SELECT 1 FROM pg_indexes WHERE indexname = %s
-        """, (idx_name,))
-        if exists:
+    found = get_catalog(conn)['idx']
+    for idx_name in REQUIRED_INDEXES:
+        if idx_name in found:
             print(f"    [PASS] Index '{idx_name}' exists")
         else:
             print(f"    [FAIL] Index '{idx_name}' not found")
@@ -559,57 +665,96 @@ def verify_indexes(conn) -> bool:
 # ============================================================
 # Main
 # ============================================================
+# Steps that write to the database; every other step runs read-only
+WRITE_STEPS = {verify_audit_trigger}
+MAX_WORKERS = 8
+
+
+def run_step(pool, verify_func):
+    """Run one step on the worker thread's own connection."""
+    try:
+        conn = pool.get(readonly=verify_func not in WRITE_STEPS)
+        return verify_func(conn)
+    except Exception as e:
+        print(f"  [ERROR] {e}")
+        return False
+
+
+def run_after(output, pool, verify_func, prerequisites):
+    """Run a step once its prerequisite steps are done; None if one failed."""
+    if not all(future.result()[0] for future in prerequisites):
+        return None, "  [SKIP] Prerequisite step failed\n"
+    return output.capture(run_step, pool, verify_func)
+
+
 def main():
-    conn = get_conn()
-    conn.autocommit = True
+    # With --fail-fast a step whose prerequisites failed is skipped
+    fail_fast = "--fail-fast" in sys.argv
 
-    print("Verifying Customer Analytics Pipeline (Chinook DB)")
+    pool = ThreadConnections(get_conn_params())
 
+    # (name, verify function, steps it depends on)
     steps = [
-        ("Step 1: monthly_revenue materialized view exists", lambda: verify_matview_exists(conn)),
-        ("Step 2: monthly_revenue data correctness", lambda: verify_matview_data(conn)),
-        ("Step 3: customer_analytics table exists", lambda: verify_customer_analytics_exists(conn)),
-        ("Step 4: customer_analytics segmentation", lambda: verify_customer_segments(conn)),
-        ("Step 5: customer_analytics values spot-check", lambda: verify_customer_values(conn)),
-        ("Step 6: genre_country_rankings exists", lambda: verify_genre_rankings_exists(conn)),
-        ("Step 7: genre_country_rankings data", lambda: verify_genre_rankings_data(conn)),
-        ("Step 8: get_customer_top_genre function exists", lambda: verify_function_exists(conn)),
-        ("Step 9: get_customer_top_genre output", lambda: verify_function_output(conn)),
-        ("Step 10: Audit trigger exists", lambda: verify_trigger_exists(conn)),
-        ("Step 11: Audit trigger fires", lambda: verify_trigger_fires(conn)),
-        ("Step 12: Indexes exist", lambda: verify_indexes(conn)),
+        ("Step 1: monthly_revenue materialized view exists", verify_matview_exists, ()),
+        ("Step 2: monthly_revenue data correctness", verify_matview_data,
+         (verify_matview_exists,)),
+        ("Step 3: customer_analytics table exists", verify_customer_analytics_exists, ()),
+        ("Step 4: customer_analytics segmentation", verify_customer_segments,
+         (verify_customer_analytics_exists,)),
+        ("Step 5: customer_analytics values spot-check", verify_customer_values,
+         (verify_customer_analytics_exists,)),
+        ("Step 6: genre_country_rankings exists", verify_genre_rankings_exists, ()),
+        ("Step 7: genre_country_rankings data", verify_genre_rankings_data,
+         (verify_genre_rankings_exists,)),
+        ("Step 8: get_customer_top_genre function exists", verify_function_exists, ()),
+        ("Step 9: get_customer_top_genre output", verify_function_output,
+         (verify_function_exists,)),
+        ("Step 10: Audit trigger exists and fires", verify_audit_trigger, ()),
+        ("Step 11: Indexes exist", verify_indexes, ()),
     ]
 
+    # The steps run concurrently; each one's output is captured and printed
+    # afterwards in step order. Prerequisites always precede their dependents
+    # in the list, so they are picked up first and waiting on them is safe.
+    output = StepOutput(sys.stdout)
+    futures = {}
+    try:
+        load_catalog(pool.get(readonly=True))
+        sys.stdout = output
+        run = partial(run_after, output, pool)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            for _, verify_func, depends_on in steps:
+                prerequisites = [futures[dep] for dep in depends_on] if fail_fast else []
+                futures[verify_func] = ex.submit(run, verify_func, prerequisites)
+        outcomes = [futures[verify_func].result() for _, verify_func, _ in steps]
+    finally:
+        sys.stdout = output.stream
+        pool.closeall()
+
+    # The whole report is assembled here and written to stdout in one call
+    report = ["Verifying Customer Analytics Pipeline (Chinook DB)\n"]
     results = []
-    for step_name, verify_func in steps:
-        print(f"\n{'=' * 55}")
-        print(f"  {step_name}")
-        print(f"{'=' * 55}")
-        try:
-            passed = verify_func()
-            results.append((step_name, passed))
-        except Exception as e:
-            print(f"  [ERROR] {e}")
-            results.append((step_name, False))
-
-    conn.close()
+    for (step_name, _, _), (passed, text) in zip(steps, outcomes):
+        report.append(f"\n{'=' * 55}\n  {step_name}\n{'=' * 55}\n")
+        report.append(text)
+        results.append((step_name, passed))
 
-    print(f"\n{'=' * 55}")
-    print("  VERIFICATION SUMMARY")
-    print(f"{'=' * 55}")
+    report.append(f"\n{'=' * 55}\n  VERIFICATION SUMMARY\n{'=' * 55}\n")
     for step_name, passed in results:
-        status = "PASS" if passed else "FAIL"
-        print(f"  [{status}] {step_name}")
+        status = "SKIP" if passed is None else "PASS" if passed else "FAIL"
+        report.append(f"  [{status}] {step_name}\n")
 
     passed_count = sum(1 for _, p in results if p)
-    print(f"\n  Result: {passed_count}/{len(results)} steps passed")
+    report.append(f"\n  Result: {passed_count}/{len(results)} steps passed\n")
 
-    if all(p for _, p in results):
-        print("\n  OVERALL: ALL CHECKS PASSED")
-        sys.exit(0)
+    all_passed = all(p for _, p in results)
+    if all_passed:
+        report.append("\n  OVERALL: ALL CHECKS PASSED\n")
     else:
-        print("\n  OVERALL: SOME CHECKS FAILED")
-        sys.exit(1)
+        report.append("\n  OVERALL: SOME CHECKS FAILED\n")
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
+    sys.exit(0 if all_passed else 1)
 
 
 if __name__ == "__main__":